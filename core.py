@@ -1,7 +1,23 @@
 import numpy as np
+from numba import njit
 from properties import PropertyPackageInterface
 from dataclasses import dataclass 
 
+
+@njit(cache=True)
+def _validate_composition(molar_composition: np.ndarray) -> tuple[float, float]:
+
+    " Returns sum and minimum entry of a composition vector in a single pass. "
+
+    total = 0.0
+    minimum = np.inf
+    for x in molar_composition:
+        total += x
+        if x < minimum:
+            minimum = x
+    return total, minimum
+
+
 @dataclass
 class Stream: 
 
@@ -14,12 +30,14 @@ class Stream:
     property_package_backend: PropertyPackageInterface     
 
     def __post_init__(self):
-        # Validate molar composition sums to 1
-        if not np.isclose(np.sum(self.molar_composition), 1.0, atol=1e-12):
+        composition_sum, composition_min = _validate_composition(self.molar_composition)
+
+        # Validate molar composition sums to 1 (same tolerance as np.isclose(sum, 1.0, atol=1e-12)), NaN fails
+        if not abs(composition_sum - 1.0) <= 1e-12 + 1e-5:
             raise ValueError("Molar_composition must sum to 1.0")
         
         # Validate no negative entries in composition
-        if (self.molar_composition < -1e-12).any():
+        if composition_min < -1e-12:
             raise ValueError("Composition has negative entries.")
         
         # Validate composition length matches backend components
@@ -1,14 +1,45 @@
+import math
 import numpy as np
+import numpy.typing as npt
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Protocol
-
-from chemicals import CAS_from_any
-from chemicals import MW as MW_data_import
-from chemicals.acentric import omega as acentric_factor_data_import
-from chemicals.critical import Tc as critical_temperature_data_import, Pc as critical_pressure_data_import
+from numba import njit, vectorize, guvectorize
 
 from scipy.constants import R
 
 
+# Row layout of PureComponentDataBackend.packed_data
+_ROW_OMEGA, _ROW_TC, _ROW_PC, _ROW_MW, _ROW_M, _ROW_TC_OVER_SQRTPC, _ROW_TC_OVER_PC, _ROW_INV_TC = range(8)
+
+# SRK attraction and co-volume constants, a_c = 0.42747 (R Tc)^2 / Pc and b = 0.08664 R Tc / Pc
+_SRK_A0 = 0.42747
+_SRK_B0 = 0.08664
+
+# Integer phase codes used by the EOS kernels and Z-factor lookups
+_PHASE_V, _PHASE_L = 0, 1
+_PHASE_CODES = {'v': _PHASE_V, 'l': _PHASE_L}
+
+
+@lru_cache(maxsize=None)
+def _lookup_pure_component_data(component: str) -> tuple[float, float, float, float]:
+    
+    " Returns (omega, Tc [K], Pc [Pa], MW [kg/mol]) for a component, shared across property packages. "
+
+    # chemicals is slow to import, defer it until component data is first requested
+    from chemicals import CAS_from_any
+    from chemicals import MW as MW_data_import
+    from chemicals.acentric import omega as acentric_factor_data_import
+    from chemicals.critical import Tc as critical_temperature_data_import, Pc as critical_pressure_data_import
+
+    component_CASRN = CAS_from_any(component)
+    return (acentric_factor_data_import(CASRN = component_CASRN),
+            critical_temperature_data_import(CASRN = component_CASRN),
+            critical_pressure_data_import(CASRN = component_CASRN),
+            MW_data_import(component_CASRN) / 1000.0)
+
+
+
 class PureComponentDataBackend():
 
     """ Pure component property package backend. """
@@ -18,14 +49,29 @@ class PureComponentDataBackend():
                  components: tuple[str, ...]):
         self.components = components
 
-        self.acentric_factor_data = np.zeros_like(a=components,dtype = float)
-        self.critical_temperature_K_data = np.zeros_like(a=components,dtype = float)
-        self.critical_pressure_Pa_data = np.zeros_like(a=components,dtype = float)
-        for k in range(len(components)):
-            compoent_CASRN = CAS_from_any(components[k])
-            self.acentric_factor_data[k] = acentric_factor_data_import(CASRN = compoent_CASRN)  
-            self.critical_temperature_K_data[k] = critical_temperature_data_import(CASRN = compoent_CASRN)  
-            self.critical_pressure_Pa_data[k] = critical_pressure_data_import(CASRN = compoent_CASRN) 
+        # Raw and derived per-component constants share one contiguous block, named attributes are row views
+        self.packed_data = np.empty((8, len(components)), dtype = np.float64)
+        for k, component in enumerate(components):
+            self.packed_data[_ROW_OMEGA:_ROW_MW + 1, k] = _lookup_pure_component_data(component)
+
+        self.acentric_factor_data = self.packed_data[_ROW_OMEGA]
+        self.critical_temperature_K_data = self.packed_data[_ROW_TC]
+        self.critical_pressure_Pa_data = self.packed_data[_ROW_PC]
+        self.molecular_weight_kg_mol_data = self.packed_data[_ROW_MW]
+
+        # Composition-independent SRK groupings, evaluated once per component set
+        omega = self.acentric_factor_data
+        Tc = self.critical_temperature_K_data
+        Pc = self.critical_pressure_Pa_data
+        self.packed_data[_ROW_M] = 0.48 + 1.574 * omega - 0.176 * omega**2
+        self.packed_data[_ROW_TC_OVER_SQRTPC] = Tc / np.sqrt(Pc)
+        self.packed_data[_ROW_TC_OVER_PC] = Tc / Pc
+        self.packed_data[_ROW_INV_TC] = 1.0 / Tc
+
+        self.m = self.packed_data[_ROW_M]
+        self.Tc_over_sqrtPc = self.packed_data[_ROW_TC_OVER_SQRTPC]
+        self.Tc_over_Pc = self.packed_data[_ROW_TC_OVER_PC]
+        self.inv_Tc = self.packed_data[_ROW_INV_TC]
 
 
 
@@ -39,17 +85,18 @@ class EquationOfStateInterface(Protocol):
     def get_fugacity_coefs(self,
                            temperature_K: float, 
                            pressure_Pa: float, 
-                           molar_composition: np.ndarray) -> np.ndarray: ...
+                           molar_composition: np.ndarray,
+                           out: np.ndarray | None = None) -> np.ndarray: ...
 
     def get_compressibility_factor(self, 
                                    temperature_K: float,
                                    pressure_Pa: float,
-                                   molar_composition: np.ndarray) -> float: ...
+                                   molar_composition: np.ndarray) -> float | np.ndarray: ...
     
     def get_density_SI(self,
                        temperature_K: float,
                        pressure_Pa: float,
-                       molar_composition: np.ndarray) -> float: ...
+                       molar_composition: np.ndarray) -> float | np.ndarray: ...
     
 
 
@@ -80,6 +127,50 @@ class PropertyPackageInterface(Protocol):
 
 
 
+@njit(cache=True, fastmath=True)
+def _rachford_rice(molar_composition: np.ndarray, 
+                   K_values: np.ndarray) -> float:
+    
+    " Solves sum z_i (K_i - 1) / (1 + beta (K_i - 1)) = 0 for vapour fraction beta by bracketed Newton. "
+    " Returns 0.0 (liquid) or 1.0 (vapour) when the K-values admit no root in (0, 1). "
+
+    n = molar_composition.shape[0]
+    f_0 = 0.0
+    f_1 = 0.0
+    for i in range(n):
+        f_0 += molar_composition[i] * (K_values[i] - 1.0)
+        f_1 += molar_composition[i] * (K_values[i] - 1.0) / K_values[i]
+    if f_0 <= 0:
+        return 0.0
+    if f_1 >= 0:
+        return 1.0
+
+    # f(beta) decreases monotonically, so the sign of f tightens the bracket
+    beta_min = 0.0
+    beta_max = 1.0
+    beta = 0.5
+    for _ in range(100):
+        f = 0.0
+        df = 0.0
+        for i in range(n):
+            t = (K_values[i] - 1.0) / (1.0 + beta * (K_values[i] - 1.0))
+            f += molar_composition[i] * t
+            df -= molar_composition[i] * t * t
+        if f > 0:
+            beta_min = beta
+        else:
+            beta_max = beta
+
+        beta_new = beta - f / df
+        if not beta_min < beta_new < beta_max:
+            beta_new = 0.5 * (beta_min + beta_max)
+        if abs(beta_new - beta) < 1e-12:
+            return beta_new
+        beta = beta_new
+    return beta
+
+
+
 class GammaPhiPackage():
 
     """ Property package to calculate VLE using activity and EOS models. """
@@ -90,6 +181,7 @@ class GammaPhiPackage():
         
         pure_component_data_backend = PureComponentDataBackend(components = components)
 
+        self.pure_component_data_backend = pure_component_data_backend
         self.eos_backend = eos_backend(components = components,
                                        pure_component_data_backend = pure_component_data_backend)
         self.activity_model_backend = activity_model_backend(components = components)
@@ -111,18 +203,57 @@ class GammaPhiPackage():
         return True
 
 
+    def _get_wilson_K_values(self, 
+                             temperature_K: float,
+                             pressure_Pa: float) -> np.ndarray:
+        " Estimates K-values with the Wilson (1968) correlation from pure component data. "
+
+        pure_data = self.pure_component_data_backend
+        K_values: np.ndarray = (pure_data.critical_pressure_Pa_data / pressure_Pa 
+                                * np.exp(5.373 * (1.0 + pure_data.acentric_factor_data) * (1.0 - pure_data.critical_temperature_K_data / temperature_K)))
+        return K_values
+
+
     def TP_flash(self, 
                  temperature_K: float,
                  pressure_Pa: float,
-                 molar_composition: np.ndarray ) -> None: 
+                 molar_composition: np.ndarray ) -> float: 
+
+        " Isothermal-isobaric flash calculation, returns vapour fraction. "
+        " Wilson K-values with Rachford-Rice classify clearly single-phase feeds without evaluating the EOS. "
+
+        K_values = self._get_wilson_K_values(temperature_K = temperature_K,
+                                             pressure_Pa = pressure_Pa)
+        vapour_fraction = _rachford_rice(molar_composition, K_values)
+        if vapour_fraction == 0.0 or vapour_fraction == 1.0:
+            return vapour_fraction
 
-        " Isothermal-isobaric flash calculation. "
         TPD_stability: bool = self._TPD_stability_test(temperature_K = temperature_K,
                                                        pressure_Pa = pressure_Pa,
                                                        molar_composition = molar_composition)
 
 
-        return None
+        # Wilson estimate, to be refined with EOS fugacities
+        return vapour_fraction
+
+
+
+def _ideal_gas_density(temperature_K: float, 
+                       pressure_Pa: float, 
+                       MW_mix_kg_mol: float) -> float:
+    
+    " Ideal gas mass density [kg/m3] of one state, compiled into a parallel ufunc by _get_ideal_gas_density_ufunc. "
+
+    density_SI: float = pressure_Pa * MW_mix_kg_mol / (R * temperature_K)
+    return density_SI
+
+
+@lru_cache(maxsize=None)
+def _get_ideal_gas_density_ufunc():
+    
+    " Builds the parallel ideal-gas density ufunc on the first batch call, keeping its compilation out of import. "
+
+    return vectorize(['float64(float64, float64, float64)'], target='parallel', cache=True)(_ideal_gas_density)
 
 
 
@@ -134,6 +265,7 @@ class IdealGasBackend:
     def __init__(self, 
                  components: tuple[str, ...]):
         self.components = components
+        self._MW_kg_mol = np.array([_lookup_pure_component_data(component)[_ROW_MW] for component in components], dtype=np.float64)
 
     def get_compressibility_factor(self, 
               temperature_K: float, 
@@ -144,11 +276,167 @@ class IdealGasBackend:
     def get_density_SI(self,
                        temperature_K: float,
                        pressure_Pa: float,
-                       molar_composition: np.ndarray) -> float:
+                       molar_composition: np.ndarray) -> float | np.ndarray:
         
-        # placeholder implementation
-        return 0.9
+        # Stream tables (one composition per row) are evaluated in parallel
+        if molar_composition.ndim > 1:
+            densities_SI: np.ndarray = _get_ideal_gas_density_ufunc()(temperature_K, pressure_Pa, molar_composition @ self._MW_kg_mol)
+            return densities_SI
+
+        density_SI: float = pressure_Pa * (molar_composition @ self._MW_kg_mol) / (R * temperature_K)
+        return density_SI
+    
+
+
+@njit(cache=True, fastmath=True)
+def _halley_step(Z: float, 
+                 p: float, 
+                 q: float) -> float:
+    
+    " One Halley iteration on f(Z) = Z^3 - Z^2 + pZ + q, as recommended for SRK roots by Michelsen & Mollerup. "
+
+    f = ((Z - 1.0) * Z + p) * Z + q
+    fp = (3.0 * Z - 2.0) * Z + p
+    if fp == 0.0:
+        return Z
+    ratio = f / fp
+    return Z - ratio / (1.0 - 0.5 * ratio * (6.0 * Z - 2.0) / fp)
+
+
+@njit(cache=True, fastmath=True)
+def _solve_SRK_cubic(A_mix: float, 
+                     B_mix: float) -> tuple[float, float]:
+    
+    " Returns vapour-like (largest) and liquid-like (smallest) positive roots of "
+    " Z^3 - Z^2 + (A - B - B^2)Z - AB = 0 in closed form (Cardano), -1.0 if none exists. "
+    " Each selected root is polished with a Halley step, since Cardano loses digits on the small liquid root. "
+
+    p = A_mix - B_mix - B_mix * B_mix
+    q = -A_mix * B_mix
+
+    # Depressed cubic via Z = y + 1/3
+    Q = (3.0 * p - 1.0) / 9.0
+    R = (2.0 - 9.0 * p - 27.0 * q) / 54.0
+    D = Q**3 + R**2
+
+    if D >= 0:
+        sqrt_D = math.sqrt(D)
+        Z = np.cbrt(R + sqrt_D) + np.cbrt(R - sqrt_D) + 1.0 / 3.0
+        if Z > 0:
+            Z = _halley_step(Z, p, q)
+            return Z, Z
+        return -1.0, -1.0
+
+    # Three real roots, trigonometric form
+    theta = math.acos(max(-1.0, min(1.0, R / math.sqrt(-Q**3))))
+    scale = 2.0 * math.sqrt(-Q)
+    # Finite sentinel: fastmath assumes no infinities
+    Z_v = -1.0
+    Z_l = 1e300
+    for k in range(3):
+        Z = scale * math.cos((theta + 2.0 * math.pi * k) / 3.0) + 1.0 / 3.0
+        if Z > 0:
+            Z_v = max(Z_v, Z)
+            Z_l = min(Z_l, Z)
+    if Z_v < 0:
+        return -1.0, -1.0
+    return _halley_step(Z_v, p, q), _halley_step(Z_l, p, q)
+
+
+@njit(cache=True, fastmath=True)
+def _srk_kernel(temperature_K: float, 
+                pressure_Pa: float, 
+                molar_composition: np.ndarray, 
+                packed_data: np.ndarray) -> tuple[np.ndarray, np.ndarray, float, float, float, float, float, float]:
+    
+    " Returns (sqrt_alpha, a_vec, sum_a, sum_b, A, B, Z_v, Z_l) of the SRK EOS for a mixture at (T, P, z), "
+    " where a_vec = sqrt_alpha * Tc / sqrt(Pc), sum_a = z @ a_vec and sum_b = z @ (Tc / Pc). "
+    " packed_data is PureComponentDataBackend.packed_data. "
+
+    n = molar_composition.shape[0]
+    # Both vectors outlive the call in the parameter cache, so they share one allocation instead of scratch buffers
+    vectors = np.empty((2, n))
+    sqrt_alpha = vectors[0]
+    a_vec = vectors[1]
+    sum_a = 0.0
+    sum_b = 0.0
+    for i in range(n):
+        sqrt_alpha[i] = 1.0 + packed_data[_ROW_M, i] * (1.0 - math.sqrt(temperature_K * packed_data[_ROW_INV_TC, i]))
+        a_vec[i] = sqrt_alpha[i] * packed_data[_ROW_TC_OVER_SQRTPC, i]
+        sum_a += molar_composition[i] * a_vec[i]
+        sum_b += molar_composition[i] * packed_data[_ROW_TC_OVER_PC, i]
+
+    inv_T = 1.0 / temperature_K
+    A_mix = _SRK_A0 * pressure_Pa * inv_T * inv_T * sum_a * sum_a
+    B_mix = _SRK_B0 * pressure_Pa * inv_T * sum_b
+
+    Z_v, Z_l = _solve_SRK_cubic(A_mix, B_mix)
+    return sqrt_alpha, a_vec, sum_a, sum_b, A_mix, B_mix, Z_v, Z_l
+
+
+@njit(cache=True, fastmath=True)
+def _srk_fugacity_kernel(Z: float, 
+                         A_mix: float, 
+                         B_mix: float, 
+                         a_vec: np.ndarray, 
+                         b_vec: np.ndarray, 
+                         sum_a: float, 
+                         sum_b: float, 
+                         fugacity_coefs: np.ndarray | None = None) -> np.ndarray:
+    
+    " Returns SRK fugacity coefficients for a phase with compressibility factor Z, "
+    " written into fugacity_coefs when a buffer is given. "
+
+    n = a_vec.shape[0]
+    inv_sum_a = 1.0 / sum_a
+    inv_sum_b = 1.0 / sum_b
+    log_Z_minus_B = math.log(Z - B_mix)
+    # log1p keeps precision at low pressure where B/Z -> 0
+    log_B_term = A_mix / B_mix * math.log1p(B_mix / Z)
+
+    if fugacity_coefs is None:
+        fugacity_coefs = np.empty(n)
+    for i in range(n):
+        alpha_ratio = a_vec[i] * inv_sum_a
+        b_ratio = b_vec[i] * inv_sum_b
+        fugacity_coefs[i] = math.exp(b_ratio * (Z - 1.0) - log_Z_minus_B - (2.0 * alpha_ratio - b_ratio) * log_B_term)
+    return fugacity_coefs
+
+
+def _check_fugacity_buffer(out: np.ndarray, 
+                           n: int) -> None:
     
+    " Validates a caller-provided fugacity coefficient buffer, as NumPy does for out=, before a kernel writes into it. "
+
+    if out.shape != (n,) or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape ({n},), got {out.dtype} array of shape {out.shape}.")
+
+
+def _srk_compressibility_gufunc(temperature_K, 
+                                pressure_Pa, 
+                                molar_composition, 
+                                packed_data, 
+                                phase_code, 
+                                Z_out):
+    
+    " SRK Z-factor of one state (phase_code 0 - vapour, 1 - liquid), -1.0 if no root exists. "
+    " Compiled into a parallel gufunc over arrays of states by _get_srk_compressibility_gufunc. "
+
+    _, _, _, _, _, _, Z_v, Z_l = _srk_kernel(temperature_K, 
+                                             pressure_Pa, 
+                                             molar_composition, 
+                                             packed_data)
+    Z_out[0] = Z_v if phase_code == _PHASE_V else Z_l
+
+
+@lru_cache(maxsize=None)
+def _get_srk_compressibility_gufunc():
+    
+    " Builds the parallel SRK Z-factor gufunc on the first batch call, keeping its compilation out of import. "
+
+    return guvectorize(['(float64, float64, float64[:], float64[:, :], int64, float64[:])'], 
+                       '(),(),(k),(r,k),()->()', target='parallel', cache=True)(_srk_compressibility_gufunc)
+
 
 
 class SoaveRedlichKwongBackend():
@@ -162,7 +450,10 @@ class SoaveRedlichKwongBackend():
                  pure_component_data_backend: PureComponentDataBackend):
         self.components = components
         self.pure_component_data_backend = pure_component_data_backend
-        self._cache = {}
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_max = 128
+        self._last_cache_key: tuple | None = None
+        self._last_params: dict = {}
 
     
     def _get_SRK_parameters(self, 
@@ -170,44 +461,51 @@ class SoaveRedlichKwongBackend():
                             pressure_Pa: float, 
                             molar_composition: np.ndarray) -> dict:
         
-        " This method calculates SRK EOS parameters (a, b, A, B). "
+        " This method calculates SRK EOS parameters (a, b, A, B) and vapour/liquid Z-factors. "
 
-        cache_key = (temperature_K, pressure_Pa, tuple(molar_composition))
-        # Return cached values if available
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cache_key = (temperature_K, pressure_Pa, molar_composition.tobytes())
+        # Back-to-back calls at the same state skip the LRU lookup
+        if cache_key == self._last_cache_key:
+            return self._last_params
 
-        omega = self.pure_component_data_backend.acentric_factor_data
-        Tc = self.pure_component_data_backend.critical_temperature_K_data
-        Pc = self.pure_component_data_backend.critical_pressure_Pa_data
+        # Return cached values if available
+        cached_params = self._cache.get(cache_key)
+        if cached_params is not None:
+            self._cache.move_to_end(cache_key)
+            self._last_cache_key, self._last_params = cache_key, cached_params
+            return cached_params
 
-        if len(molar_composition) > 1: 
-            m   = 0.48 + 1.574 * omega - 0.176 * omega**2
-            T_r = temperature_K / Tc
-            alpha = (1 + m * (1 - np.sqrt(T_r)))**2       
-            
-            # a_c = 0.42747 * (R**2 * Tc**2) / Pc
-            # b   = 0.08664 * (R * Tc) / Pc
+        pure_data = self.pure_component_data_backend
 
-            # a = a_c * alpha 
+        # a_c = 0.42747 * (R**2 * Tc**2) / Pc
+        # b   = 0.08664 * (R * Tc) / Pc
 
-            # a_mix = (molar_composition @ np.sqrt(a))**2
-            # b_mix = molar_composition @ b 
+        # a = a_c * alpha 
 
-            A_mix = 0.42747 * pressure_Pa / temperature_K**2 * ( molar_composition @ (Tc * np.sqrt(alpha) / np.sqrt(Pc)) )**2
-            B_mix = 0.08664 * pressure_Pa / temperature_K * ( molar_composition @ (Tc / Pc) )
+        # a_mix = (molar_composition @ np.sqrt(a))**2
+        # b_mix = molar_composition @ b 
 
+        sqrt_alpha, a_vec, sum_a, sum_b, A_mix, B_mix, Z_v, Z_l = _srk_kernel(temperature_K, 
+                                                                              pressure_Pa, 
+                                                                              molar_composition, 
+                                                                              pure_data.packed_data)
         
         params = {
-            'alpha': alpha,
+            'sqrt_alpha': sqrt_alpha,
+            'a_vec': a_vec,
+            'b_vec': pure_data.Tc_over_Pc,
+            'sum_a': sum_a,
+            'sum_b': sum_b,
             'A_mix': A_mix,
             'B_mix': B_mix,
-            'Tc': Tc,
-            'Pc': Pc,
+            'Z': (Z_v if Z_v > 0 else None, Z_l if Z_l > 0 else None),
         }
         
-        # Cache the results
-        self._cache = {cache_key: params} 
+        # Cache the results, evicting the least recently used entry
+        self._cache[cache_key] = params
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+        self._last_cache_key, self._last_params = cache_key, params
         return params
 
 
@@ -215,28 +513,28 @@ class SoaveRedlichKwongBackend():
                                    phase: str, 
                                    temperature_K: float, 
                                    pressure_Pa: float, 
-                                   molar_composition: np.ndarray) -> float:
+                                   molar_composition: np.ndarray) -> float | np.ndarray:
         
-        " This method solves the SRK cubic equation of state for Z-factor. "
+        " This method returns the SRK Z-factor for the requested phase, solved once per state in _get_SRK_parameters. "
         " The methods is based on original work by Soave (1972). "
 
-        params = self._get_SRK_parameters(temperature_K, pressure_Pa, molar_composition)
-        A_mix  = params['A_mix']
-        B_mix  = params['B_mix']
+        phase_code = _PHASE_CODES.get(phase)
+        if phase_code is None: 
+            raise Exception("Phase is not specified properly, please select either 'v' for vapour or 'l' for liquid")
 
-        # Cubic equation coefficients: Z^3 - Z^2 + (A - B - B^2)Z - AB = 0
-        coefs = [1, -1, A_mix - B_mix - B_mix**2, -1 * A_mix * B_mix]
-        roots = np.roots(coefs)
+        # Stream tables (one composition per row) bypass the cache and are evaluated in parallel
+        if molar_composition.ndim > 1:
+            pure_data = self.pure_component_data_backend
+            Z_vals: np.ndarray = _get_srk_compressibility_gufunc()(temperature_K, 
+                                                                   pressure_Pa, 
+                                                                   molar_composition, 
+                                                                   pure_data.packed_data, 
+                                                                   phase_code)
+            if (Z_vals <= 0).any():
+                raise ValueError("No physically meaningful compressibility factor found")
+            return Z_vals
 
-        real_roots = roots[np.abs(roots.imag) < 1e-10].real
-        positive_roots = real_roots[real_roots > 0]
-        
-        if phase == 'v':
-            Z_val = np.max(positive_roots) if len(positive_roots) > 0 else None
-        elif phase == 'l':
-            Z_val = np.min(positive_roots) if len(positive_roots) > 0 else None
-        else: 
-            raise Exception("Phase is not specified properly, please select either 'v' for vapour or 'l' for liquid")
+        Z_val = self._get_SRK_parameters(temperature_K, pressure_Pa, molar_composition)['Z'][phase_code]
 
         if Z_val is None:
             raise ValueError("No physically meaningful compressibility factor found")
@@ -247,34 +545,189 @@ class SoaveRedlichKwongBackend():
     def get_fugacity_coefs(self, 
                            temperature_K: float, 
                            pressure_Pa: float, 
-                           molar_composition: np.ndarray) -> np.ndarray:
+                           molar_composition: np.ndarray,
+                           out: np.ndarray | None = None) -> np.ndarray:
         
         " This method calculates fugacity coefficients using SRK EOS based on determined Z-factor. "
         " The method is based on original work by Soave (1972). "
+        " Flash loops can pass a preallocated float64 buffer as out to avoid a new array per call. "
         
         params = self._get_SRK_parameters(temperature_K, pressure_Pa, molar_composition)
-        alpha  = params['alpha']
-        A_mix  = params['A_mix']
-        B_mix  = params['B_mix']
-        Tc     = params['Tc']
-        Pc     = params['Pc']
+
+        Z_val = params['Z'][_PHASE_V]
+        if Z_val is None:
+            raise ValueError("No physically meaningful compressibility factor found")
+
+        if out is not None:
+            _check_fugacity_buffer(out, params['a_vec'].shape[0])
+
+        return _srk_fugacity_kernel(Z_val, 
+                                    params['A_mix'], 
+                                    params['B_mix'], 
+                                    params['a_vec'], 
+                                    params['b_vec'], 
+                                    params['sum_a'], 
+                                    params['sum_b'], 
+                                    out)
+
+
+    def get_density_SI(self,
+                       temperature_K: float,
+                       pressure_Pa: float,
+                       molar_composition: np.ndarray) -> float | np.ndarray:
+        
+        " This method calculates vapour mass density [kg/m3] based on determined Z-factor. "
 
         Z_val = self.get_compressibility_factor(temperature_K=temperature_K,
                                                 pressure_Pa=pressure_Pa,
                                                 molar_composition=molar_composition,
                                                 phase='v')
+        
+        MW_mix = molar_composition @ self.pure_component_data_backend.molecular_weight_kg_mol_data
+        density_SI: float | np.ndarray = pressure_Pa * MW_mix / (Z_val * R * temperature_K)
+        return density_SI
+
+
+
+class TabulatedBackend():
+
+    """ Tabulated EOS backend for a fixed composition and bounded (T, P) window. """
+    name = 'Tabulated'
+    components: tuple[str, ...]
+    pure_component_data_backend: PureComponentDataBackend
+
+    def __init__(self, 
+                 components: tuple[str, ...],
+                 pure_component_data_backend: PureComponentDataBackend,
+                 molar_composition: np.ndarray,
+                 temperature_range_K: tuple[float, float, int],
+                 pressure_range_Pa: tuple[float, float, int],
+                 eos_backend: type = SoaveRedlichKwongBackend,
+                 dtype: npt.DTypeLike = np.float64):
+        
+        " Evaluates the wrapped EOS on a uniform (T, log10 P) grid once, queries are bilinear interpolations. "
+        " States outside the window or at another composition are delegated to the wrapped EOS. "
+        " Interpolation across a phase boundary smears the Z-factor jump, so keep the window within one root branch. "
+        " dtype = np.float32 halves table memory and lookup bandwidth at ~1e-7 relative storage error. "
+
+        self.components = components
+        self.pure_component_data_backend = pure_component_data_backend
+        self.eos_backend = eos_backend(components = components,
+                                       pure_component_data_backend = pure_component_data_backend)
+
+        self.molar_composition = np.ascontiguousarray(molar_composition, dtype = np.float64)
+        self._composition_key = self.molar_composition.tobytes()
+        self._MW_mix_over_R = self.molar_composition @ pure_component_data_backend.molecular_weight_kg_mol_data / R
+
+        T_min, T_max, NT = temperature_range_K
+        P_min, P_max, NP = pressure_range_Pa
+        if NT < 2 or NP < 2:
+            raise ValueError("Tabulation grid needs at least 2 points in temperature and in pressure.")
+        if not T_max > T_min:
+            raise ValueError("Temperature range must satisfy T_max > T_min.")
+        if not P_max > P_min > 0:
+            raise ValueError("Pressure range must satisfy P_max > P_min > 0.")
+        self._T_min, self._T_max = T_min, T_max
+        self._log10P_min, self._log10P_max = math.log10(P_min), math.log10(P_max)
+        self._inv_dT = (NT - 1) / (T_max - T_min)
+        self._inv_dlog10P = (NP - 1) / (self._log10P_max - self._log10P_min)
+
+        temperature_grid_K = np.linspace(T_min, T_max, NT)
+        pressure_grid_Pa = np.logspace(self._log10P_min, self._log10P_max, NP)
+
+        self._Z_table: np.ndarray = np.empty((2, NT, NP), dtype = dtype)
+        self._fugacity_coefs_table: np.ndarray = np.empty((NT, NP, len(components)), dtype = dtype)
+        for i, T in enumerate(temperature_grid_K):
+            for j, P in enumerate(pressure_grid_Pa):
+                self._Z_table[_PHASE_V, i, j] = self.eos_backend.get_compressibility_factor('v', T, P, self.molar_composition)
+                self._Z_table[_PHASE_L, i, j] = self.eos_backend.get_compressibility_factor('l', T, P, self.molar_composition)
+                self._fugacity_coefs_table[i, j] = self.eos_backend.get_fugacity_coefs(T, P, self.molar_composition)
+
+
+    def _in_table(self, 
+                  temperature_K: float, 
+                  pressure_Pa: float, 
+                  molar_composition: np.ndarray) -> bool:
+        
+        " Checks whether a state can be served from the table. "
 
-        alpha_ratio = np.divide(np.sqrt(alpha) * Tc / np.sqrt(Pc), 
-                                molar_composition @ (np.sqrt(alpha) * Tc / np.sqrt(Pc)))
+        return (molar_composition.tobytes() == self._composition_key
+                and self._T_min <= temperature_K <= self._T_max
+                and self._log10P_min <= math.log10(pressure_Pa) <= self._log10P_max)
+
+
+    def _interpolate(self, 
+                     table: np.ndarray, 
+                     temperature_K: float, 
+                     pressure_Pa: float):
         
-        b_ratio = np.divide((Tc / Pc), 
-                             molar_composition @ (Tc / Pc))
+        " Bilinear interpolation in (T, log10 P) on the uniform grid, evaluated in the table dtype. "
+
+        x = (temperature_K - self._T_min) * self._inv_dT
+        y = (math.log10(pressure_Pa) - self._log10P_min) * self._inv_dlog10P
+        i = min(int(x), table.shape[0] - 2)
+        j = min(int(y), table.shape[1] - 2)
+        tx = x - i
+        ty = y - j
+
+        return ((1.0 - tx) * ((1.0 - ty) * table[i, j] + ty * table[i, j + 1])
+                + tx * ((1.0 - ty) * table[i + 1, j] + ty * table[i + 1, j + 1]))
 
-        phi_log = b_ratio * (Z_val - 1) - np.log(Z_val - B_mix) - A_mix / B_mix * (2 * alpha_ratio - b_ratio) * np.log(1 + B_mix / Z_val)
+
+    def get_compressibility_factor(self, 
+                                   phase: str, 
+                                   temperature_K: float, 
+                                   pressure_Pa: float, 
+                                   molar_composition: np.ndarray) -> float:
         
-        fugacity_coefs = np.exp(phi_log)
-        return fugacity_coefs
+        " This method interpolates the tabulated Z-factor for the requested phase. "
+
+        if not self._in_table(temperature_K, pressure_Pa, molar_composition):
+            Z_val: float = self.eos_backend.get_compressibility_factor(phase, temperature_K, pressure_Pa, molar_composition)
+            return Z_val
+
+        phase_code = _PHASE_CODES.get(phase)
+        if phase_code is None: 
+            raise Exception("Phase is not specified properly, please select either 'v' for vapour or 'l' for liquid")
+
+        return float(self._interpolate(self._Z_table[phase_code], temperature_K, pressure_Pa))
+
+
+    def get_fugacity_coefs(self, 
+                           temperature_K: float, 
+                           pressure_Pa: float, 
+                           molar_composition: np.ndarray,
+                           out: np.ndarray | None = None) -> np.ndarray:
         
+        " This method interpolates the tabulated fugacity coefficients. "
+
+        fugacity_coefs: np.ndarray
+        if not self._in_table(temperature_K, pressure_Pa, molar_composition):
+            fugacity_coefs = self.eos_backend.get_fugacity_coefs(temperature_K, pressure_Pa, molar_composition, out)
+            return fugacity_coefs
+
+        fugacity_coefs = self._interpolate(self._fugacity_coefs_table, temperature_K, pressure_Pa)
+        if out is None:
+            return fugacity_coefs.astype(np.float64, copy = False)
+        _check_fugacity_buffer(out, len(self.components))
+        out[:] = fugacity_coefs
+        return out
+
+
+    def get_density_SI(self,
+                       temperature_K: float,
+                       pressure_Pa: float,
+                       molar_composition: np.ndarray) -> float:
+        
+        " This method calculates vapour mass density [kg/m3] from the tabulated Z-factor. "
+
+        if not self._in_table(temperature_K, pressure_Pa, molar_composition):
+            density_SI: float = self.eos_backend.get_density_SI(temperature_K, pressure_Pa, molar_composition)
+            return density_SI
+
+        Z_val = float(self._interpolate(self._Z_table[_PHASE_V], temperature_K, pressure_Pa))
+        return float(pressure_Pa * self._MW_mix_over_R / (Z_val * temperature_K))
+
 
 
 class ActivityModelBackend():